@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from rest.views import COLLECTION_NAME, DB_NAME, mongo_uri
+
+
+class Command(BaseCommand):
+    """
+    One-off migration converting legacy datetime created_at values to Int64
+    epoch nanoseconds, so the created_at sort sees a single BSON type.
+    Idempotent; safe to re-run until it reports no remaining dates.
+    """
+
+    help = 'Convert legacy datetime created_at values on todos to Int64 epoch nanoseconds.'
+
+    def handle(self, *args, **options):
+        legacy_filter = {'created_at': {'$type': 'date'}}
+
+        # Dedicated client without the API's request-sized socket timeout, so
+        # a large collection is not cut off mid-update.
+        client = MongoClient(mongo_uri, serverSelectionTimeoutMS=3000)
+        try:
+            todos = client[DB_NAME][COLLECTION_NAME]
+            result = todos.update_many(
+                legacy_filter,
+                [{'$set': {'created_at': {'$multiply': [{'$toLong': '$created_at'}, 1000000]}}}]
+            )
+            remaining = todos.count_documents(legacy_filter)
+        except PyMongoError as e:
+            raise CommandError(f"created_at migration failed: {str(e)}")
+        finally:
+            client.close()
+
+        if remaining:
+            raise CommandError(f"{remaining} todos still have a datetime created_at; re-run the migration.")
+
+        self.stdout.write(self.style.SUCCESS(f"Migrated created_at on {result.modified_count} todos."))
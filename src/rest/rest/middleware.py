@@ -0,0 +1,36 @@
+import logging
+
+import orjson
+from django.core.exceptions import PermissionDenied, SuspiciousOperation
+from django.http import Http404, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+
+class JSONExceptionMiddleware:
+    """
+    Log unexpected exceptions that escape the views and answer with the API's
+    JSON error shape instead of Django's HTML error page. Views only handle the
+    database errors they can translate; everything else ends up here.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        # Leave exceptions Django maps to 404/403/400 to its normal handling
+        if isinstance(exception, (Http404, PermissionDenied, SuspiciousOperation)):
+            return None
+
+        logger.exception(f"Unexpected error handling {request.method} {request.path}")
+        return HttpResponse(
+            orjson.dumps({
+                'success': False,
+                'error': 'An unexpected error occurred. Please try again.'
+            }),
+            status=500,
+            content_type='application/json'
+        )
@@ -39,7 +39,8 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
-    'corsheaders'
+    'corsheaders',
+    'rest',
 ]
 
 MIDDLEWARE = [
@@ -51,6 +52,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'rest.middleware.JSONExceptionMiddleware',
 ]
 
 ROOT_URLCONF = 'rest.urls'
@@ -81,6 +83,23 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': 'mydatabase',
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_MAX_CONN_AGE', 60)),
+    }
+}
+
+
+# Cache
+# Redis-backed cache used for read-mostly API responses (e.g. the todo list).
+# Cache errors are swallowed so a Redis outage falls back to MongoDB reads.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://' + os.environ.get('REDIS_HOST', 'redis') + ':' + os.environ.get('REDIS_PORT', '6379') + '/0',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'IGNORE_EXCEPTIONS': True,
+        },
     }
 }
 
@@ -14,9 +14,10 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.urls import path, include
-from .views import TodoListView, TodoDetailView
+from .views import TodoListView, TodoBulkView, TodoDetailView
 
 urlpatterns = [
     path('todos/', TodoListView.as_view(), name='todo-list'),
+    path('todos/bulk/', TodoBulkView.as_view(), name='todo-bulk'),
     path('todos/<str:todo_id>/', TodoDetailView.as_view(), name='todo-detail'),
 ]
@@ -1,23 +1,217 @@
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 from rest_framework.views import APIView
-from rest_framework.response import Response
 from rest_framework import status
 import json
 import logging
+import orjson
 import os
-from datetime import datetime
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, OperationFailure
-from bson import ObjectId
+import threading
+import time
+from cachetools import TTLCache
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure, PyMongoError
+from pymongo.read_preferences import ReadPreference
+from pymongo.write_concern import WriteConcern
+from bson import Int64, ObjectId
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # MongoDB connection setup
 mongo_uri = 'mongodb://' + os.environ["MONGO_HOST"] + ':' + os.environ["MONGO_PORT"]
-db = MongoClient(mongo_uri)['test_db']
+
+# One client per worker process (uWSGI lazy-apps), reused across requests.
+# The pool is sized explicitly so connections stay warm between requests
+# and bursts cannot open an unbounded number of sockets.
+db_client = MongoClient(
+    mongo_uri,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', 50)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', 10)),
+    maxIdleTimeMS=60000,
+    socketTimeoutMS=5000,
+    connectTimeoutMS=3000,
+    serverSelectionTimeoutMS=3000,
+)
+DB_NAME = 'test_db'
+db = db_client[DB_NAME]
 COLLECTION_NAME = 'todos'
 
+# Todo writes are not critical enough to wait for the journal flush; the
+# server acknowledges as soon as the write is applied in memory.
+TODOS = db.get_collection(COLLECTION_NAME, write_concern=WriteConcern(w=1, j=False))
+
+# Handle for paginated list reads, which are never cached and tolerate slight
+# staleness, so they may be served by a secondary when one is available. The
+# cached full list is always read from the primary so a lagging secondary
+# cannot pin a pre-write list in Redis.
+TODOS_LIST_READ = db.get_collection(COLLECTION_NAME, read_preference=ReadPreference.SECONDARY_PREFERRED)
+
+MAX_DESCRIPTION_LENGTH = 500
+
+# Fields returned to clients; reads fetch only these from MongoDB
+TODO_PROJECTION = {'_id': 1, 'description': 1, 'created_at': 1, 'completed': 1}
+
+# Cached GET /todos body. The key embeds a generation counter that every
+# write advances, so a GET that read MongoDB before a write can only fill a
+# key that is no longer looked up.
+TODOS_LIST_CACHE_KEY = 'todos:list:v1'
+TODOS_LIST_GENERATION_KEY = 'todos:list:generation'
+TODOS_LIST_CACHE_TTL = 15  # seconds
+
+# Per-process cache of formatted todos keyed by canonical (lowercase hex) id,
+# in front of the shared Redis list cache. Entries are dropped on PUT and
+# DELETE by the worker that handles the write; other workers see the change
+# within the TTL. TTLCache is not thread-safe, so access goes through a lock.
+# _todo_cache_generation counts evictions so a GET that read MongoDB before a
+# concurrent write does not cache the old document.
+_todo_cache = TTLCache(maxsize=1024, ttl=30)
+_todo_cache_lock = threading.Lock()
+_todo_cache_generation = 0
+
+# Upper bounds for the optional ?limit= and ?skip= pagination parameters on
+# GET /todos; skip must fit the BSON int64 the query is encoded with
+MAX_PAGE_SIZE = 1000
+MAX_SKIP = 2 ** 63 - 1
+
+# Documents fetched per cursor batch and emitted per streamed chunk on
+# paginated GET /todos
+TODOS_BATCH_SIZE = 500
+
+# Maximum number of todos accepted by one POST /todos/bulk request
+MAX_BULK_SIZE = 1000
+
+# Shared error payloads. They are only read when serialized, so the same
+# dicts can be reused across requests.
+ERR_DESC_REQUIRED = {
+    'success': False,
+    'error': 'Description is required and cannot be empty.'
+}
+ERR_DESC_TOO_LONG = {
+    'success': False,
+    'error': f'Description cannot exceed {MAX_DESCRIPTION_LENGTH} characters.'
+}
+ERR_INVALID_ID = {
+    'success': False,
+    'error': 'Invalid todo ID format.'
+}
+ERR_NOT_FOUND = {
+    'success': False,
+    'error': 'Todo not found.'
+}
+ERR_DB_CONNECTION = {
+    'success': False,
+    'error': 'Database connection failed. Please try again later.'
+}
+ERR_DB_OPERATION = {
+    'success': False,
+    'error': 'Database operation failed. Please try again.'
+}
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _json_response(payload, status_code=status.HTTP_200_OK):
+    """
+    Build a JSON HttpResponse serialized with orjson, bypassing DRF's
+    content negotiation and renderer.
+    """
+    return HttpResponse(orjson.dumps(payload), status=status_code, content_type='application/json')
+
+
+def _validate_description(data):
+    """
+    Extract and validate the description field shared by POST and PUT.
+    
+    Returns:
+        tuple: (description, None) when valid, (None, error payload) otherwise
+    """
+    description = data.get('description') if isinstance(data, dict) else None
+    description = description.strip() if isinstance(description, str) else ''
+    if not description:
+        return None, ERR_DESC_REQUIRED
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        return None, ERR_DESC_TOO_LONG
+    return description, None
+
+
+def _get_cached_todo(key):
+    """
+    Return (cached todo or None, current eviction generation).
+    """
+    with _todo_cache_lock:
+        return _todo_cache.get(key), _todo_cache_generation
+
+
+def _cache_todo(key, todo, generation):
+    """
+    Cache a todo read from MongoDB, unless an eviction happened since the
+    generation was taken (the read may predate that write).
+    """
+    with _todo_cache_lock:
+        if _todo_cache_generation == generation:
+            _todo_cache[key] = todo
+
+
+def _evict_cached_todo(key):
+    """
+    Drop a todo from the per-process cache after a write.
+    """
+    global _todo_cache_generation
+    with _todo_cache_lock:
+        _todo_cache_generation += 1
+        _todo_cache.pop(key, None)
+
+
+def _todo_list_cache_key():
+    """
+    Cache key for the current generation of the GET /todos body. Must be read
+    before querying MongoDB.
+    """
+    return f"{TODOS_LIST_CACHE_KEY}:{cache.get(TODOS_LIST_GENERATION_KEY, 0)}"
+
+
+def _invalidate_todo_list():
+    """
+    Advance the list generation after a write. Cached bodies from earlier
+    generations, including ones still being built by in-flight GETs, are
+    never served again and expire with their TTL.
+    """
+    cache.add(TODOS_LIST_GENERATION_KEY, 0, timeout=None)
+    cache.incr(TODOS_LIST_GENERATION_KEY)
+
+
+def _format_timestamp(value):
+    """
+    Render a stored created_at value as an ISO 8601 UTC string.
+    created_at is stored as Int64 nanoseconds since the epoch; legacy datetime
+    values (see the migrate_created_at management command) still render.
+    """
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=timezone.utc).isoformat()
+    return (_EPOCH + timedelta(microseconds=value // 1000)).isoformat()
+
+
+def _format_todo(todo):
+    """
+    Format a todo document for JSON response, in place.
+    Converts ObjectId to string and the stored timestamp to ISO format.
+    Documents come fresh from the driver (or were just built by the view),
+    so mutating them is safe.
+    """
+    if not todo:
+        return None
+    
+    todo['_id'] = str(todo['_id'])
+    created_at = todo.get('created_at')
+    if created_at is not None:
+        todo['created_at'] = _format_timestamp(created_at)
+    return todo
+
 
 class TodoListView(APIView):
     """
@@ -25,79 +219,125 @@ class TodoListView(APIView):
     Supports GET (retrieve all todos) and POST (create new todo).
     """
 
-    def _format_todo(self, todo):
-        """
-        Helper method to format todo document for JSON response.
-        Converts ObjectId to string and datetime to ISO format.
+    def _stream_todos(self, first_todo, todos_cursor):
         """
-        if not todo:
-            return None
+        Generator yielding a paginated GET /todos JSON body one cursor batch
+        at a time. Documents are formatted with _format_todo and serialized
+        with orjson.
         
-        # Create a copy to avoid modifying the original
-        formatted = dict(todo)
+        The 200 status is already sent when this runs. If a later cursor
+        batch fails, the error is logged and the body ends without closing
+        the JSON, so clients get a parse error instead of a silently short
+        list.
+        """
+        yield b'{"success":true,"data":['
         
-        # Convert ObjectId to string
-        if '_id' in formatted:
-            formatted['_id'] = str(formatted['_id'])
+        todos = chain([first_todo], todos_cursor) if first_todo is not None else ()
+        count = 0
+        batch = []
+        try:
+            for todo in todos:
+                batch.append(orjson.dumps(_format_todo(todo)))
+                count += 1
+                if len(batch) >= TODOS_BATCH_SIZE:
+                    # Separate from the previous batch, if any
+                    yield (b',' if count > len(batch) else b'') + b','.join(batch)
+                    batch = []
+        except PyMongoError as e:
+            logger.error(f"MongoDB error while streaming todos after {count} documents: {str(e)}")
+            return
+        if batch:
+            yield (b',' if count > len(batch) else b'') + b','.join(batch)
         
-        # Convert datetime to ISO format string
-        if 'created_at' in formatted and isinstance(formatted['created_at'], datetime):
-            formatted['created_at'] = formatted['created_at'].isoformat()
+        yield b'],"count":' + str(count).encode() + b'}'
         
-        return formatted
+        logger.info(f"Successfully retrieved {count} todos")
 
     def get(self, request):
         """
-        Retrieve all TODO items from MongoDB.
+        Retrieve TODO items from MongoDB, newest first.
+        
+        Optional query parameters:
+            limit: maximum number of todos to return (1-1000); omit for all
+            skip: number of todos to skip (0 to 2**63 - 1)
         
         Returns:
-            Response: JSON response containing list of todos or error message
+            HttpResponse: JSON response containing list of todos or error message
         """
         try:
-            # Get todos collection
-            todos_collection = db[COLLECTION_NAME]
-            
-            # Fetch all todos from MongoDB, sorted by creation date (newest first)
-            todos_cursor = todos_collection.find().sort('created_at', -1)
-            
-            # Convert MongoDB documents to list and format for JSON response
-            todos = []
-            for todo in todos_cursor:
-                # Convert ObjectId to string for JSON serialization
-                todo['_id'] = str(todo['_id'])
-                # Convert datetime to ISO format string for JSON serialization
-                if 'created_at' in todo and isinstance(todo['created_at'], datetime):
-                    todo['created_at'] = todo['created_at'].isoformat()
-                todos.append(todo)
-            
-            logger.info(f"Successfully retrieved {len(todos)} todos")
+            # Validate pagination parameters
+            try:
+                limit = int(request.query_params.get('limit', 0))
+                skip = int(request.query_params.get('skip', 0))
+            except ValueError:
+                limit = skip = -1
+            if ('limit' in request.query_params and not 1 <= limit <= MAX_PAGE_SIZE) or not 0 <= skip <= MAX_SKIP:
+                return _json_response(
+                    {
+                        'success': False,
+                        'error': f'limit must be between 1 and {MAX_PAGE_SIZE} and skip between 0 and {MAX_SKIP}.'
+                    },
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            paginated = bool(limit or skip)
+            
+            # Serve the already-serialized body when it is cached
+            if not paginated:
+                cache_key = _todo_list_cache_key()
+                cached_body = cache.get(cache_key)
+                if cached_body is not None:
+                    return HttpResponse(cached_body, content_type='application/json')
+            
+            # Fetch todos from MongoDB, sorted by creation date (newest first).
+            # The sort is served by the created_at index (ensure_todo_indexes).
+            # Only uncached paginated reads may go to a secondary.
+            collection = TODOS_LIST_READ if paginated else TODOS
+            todos_cursor = (
+                collection.find({}, projection=TODO_PROJECTION)
+                .sort('created_at', -1)
+                .skip(skip)
+                .limit(limit)
+                .batch_size(TODOS_BATCH_SIZE)
+            )
             
-            return Response(
-                {
+            if not paginated:
+                # The full list is cached, so build the body in one go rather
+                # than streaming it
+                todos = [_format_todo(todo) for todo in todos_cursor]
+                body = orjson.dumps({
                     'success': True,
                     'data': todos,
                     'count': len(todos)
-                },
-                status=status.HTTP_200_OK
+                })
+                cache.set(cache_key, body, TODOS_LIST_CACHE_TTL)
+                
+                logger.info(f"Successfully retrieved {len(todos)} todos")
+                
+                return HttpResponse(body, content_type='application/json')
+            
+            # Fetch the first batch here so connection errors are still
+            # reported as error responses rather than a truncated stream
+            first_todo = next(todos_cursor, None)
+            
+            return StreamingHttpResponse(
+                self._stream_todos(first_todo, todos_cursor),
+                content_type='application/json'
             )
             
         except ConnectionFailure as e:
             logger.error(f"MongoDB connection error: {str(e)}")
-            return Response(
-                {
-                    'success': False,
-                    'error': 'Database connection failed. Please try again later.'
-                },
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            return _json_response(
+                ERR_DB_CONNECTION,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
             )
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving todos: {str(e)}")
-            return Response(
+        except PyMongoError as e:
+            logger.error(f"MongoDB error retrieving todos: {str(e)}")
+            return _json_response(
                 {
                     'success': False,
                     'error': 'An unexpected error occurred while retrieving todos.'
                 },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
     def post(self, request):
@@ -110,111 +350,258 @@ class TodoListView(APIView):
             }
         
         Returns:
-            Response: JSON response containing created todo or error message
+            HttpResponse: JSON response containing created todo or error message
         """
         try:
-            # Extract description from request data
-            description = request.data.get('description', '').strip()
-            
-            # Validate input
-            if not description:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Description is required and cannot be empty.'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Check description length (reasonable limit)
-            MAX_DESCRIPTION_LENGTH = 500
-            if len(description) > MAX_DESCRIPTION_LENGTH:
-                return Response(
-                    {
-                        'success': False,
-                        'error': f'Description cannot exceed {MAX_DESCRIPTION_LENGTH} characters.'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Get todos collection
-            todos_collection = db[COLLECTION_NAME]
+            # Extract and validate description
+            description, error = _validate_description(request.data)
+            if error is not None:
+                return _json_response(error, status_code=status.HTTP_400_BAD_REQUEST)
             
             # Create todo document
             todo_doc = {
                 'description': description,
-                'created_at': datetime.utcnow(),
+                'created_at': Int64(time.time_ns()),
                 'completed': False
             }
             
             # Insert into MongoDB
-            result = todos_collection.insert_one(todo_doc)
-            
-            # Retrieve the created document
-            created_todo = todos_collection.find_one({'_id': result.inserted_id})
+            try:
+                result = TODOS.insert_one(todo_doc)
+            finally:
+                # A network error can surface after the server applied the
+                # write, so the cached list is stale either way
+                _invalidate_todo_list()
             
-            # Format the created todo
-            formatted_todo = self._format_todo(created_todo)
+            # The inserted document is already in hand; no need to re-read it
+            todo_doc['_id'] = result.inserted_id
+            formatted_todo = _format_todo(todo_doc)
             
             logger.info(f"Successfully created todo with id: {result.inserted_id}")
             
-            return Response(
+            return _json_response(
                 {
                     'success': True,
                     'data': formatted_todo,
                     'message': 'Todo created successfully'
                 },
-                status=status.HTTP_201_CREATED
+                status_code=status.HTTP_201_CREATED
             )
             
         except ConnectionFailure as e:
             logger.error(f"MongoDB connection error: {str(e)}")
-            return Response(
+            return _json_response(
+                ERR_DB_CONNECTION,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        except OperationFailure as e:
+            logger.error(f"MongoDB operation error: {str(e)}")
+            return _json_response(
+                ERR_DB_OPERATION,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except PyMongoError as e:
+            logger.error(f"MongoDB error creating todo: {str(e)}")
+            return _json_response(
                 {
                     'success': False,
-                    'error': 'Database connection failed. Please try again later.'
+                    'error': 'An unexpected error occurred while creating the todo.'
                 },
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        except OperationFailure as e:
-            logger.error(f"MongoDB operation error: {str(e)}")
-            return Response(
+
+
+class TodoBulkView(APIView):
+    """
+    API view for creating many TODO items in one request.
+    Supports POST (create todos with a single insert_many).
+    """
+
+    def post(self, request):
+        """
+        Create several TODO items in MongoDB with one round-trip.
+        
+        Expected request body:
+            [
+                {"description": "string" (required)},
+                ...
+            ]
+        
+        Returns:
+            HttpResponse: JSON response containing created todos or error message
+        """
+        try:
+            items = request.data
+            if not isinstance(items, list) or not items:
+                return _json_response(
+                    {
+                        'success': False,
+                        'error': 'Request body must be a non-empty list of todos.'
+                    },
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            if len(items) > MAX_BULK_SIZE:
+                return _json_response(
+                    {
+                        'success': False,
+                        'error': f'Cannot create more than {MAX_BULK_SIZE} todos at once.'
+                    },
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            # Validate every item before writing anything
+            todo_docs = []
+            for index, item in enumerate(items):
+                description, error = _validate_description(item)
+                if error is not None:
+                    return _json_response(
+                        {
+                            'success': False,
+                            'error': f"Item {index}: {error['error']}"
+                        },
+                        status_code=status.HTTP_400_BAD_REQUEST
+                    )
+                
+                todo_docs.append({
+                    'description': description,
+                    'created_at': Int64(time.time_ns()),
+                    'completed': False
+                })
+            
+            # Insert all todos in a single round-trip. insert_many sets _id on
+            # each document, so the response is built without re-reading them.
+            try:
+                result = TODOS.insert_many(todo_docs, ordered=False)
+            finally:
+                # With ordered=False some documents may be written even when
+                # the call fails, so the cached list is stale either way
+                _invalidate_todo_list()
+            
+            formatted_todos = [_format_todo(todo_doc) for todo_doc in todo_docs]
+            
+            logger.info(f"Successfully created {len(result.inserted_ids)} todos")
+            
+            return _json_response(
+                {
+                    'success': True,
+                    'data': formatted_todos,
+                    'count': len(formatted_todos),
+                    'message': 'Todos created successfully'
+                },
+                status_code=status.HTTP_201_CREATED
+            )
+            
+        except BulkWriteError as e:
+            # Report which todos were created so the client can reconcile
+            failed_indexes = sorted(error['index'] for error in e.details.get('writeErrors', []))
+            failed = set(failed_indexes)
+            created_todos = [
+                _format_todo(todo_doc)
+                for index, todo_doc in enumerate(todo_docs)
+                if index not in failed
+            ]
+            inserted_count = e.details.get('nInserted', 0)
+            logger.error(f"MongoDB bulk insert partially failed: {inserted_count} inserted, failed indexes {failed_indexes}")
+            return _json_response(
                 {
                     'success': False,
-                    'error': 'Database operation failed. Please try again.'
+                    'error': 'Some todos could not be created.',
+                    'data': created_todos,
+                    'inserted_count': inserted_count,
+                    'failed_indexes': failed_indexes
                 },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                status_code=status.HTTP_207_MULTI_STATUS if inserted_count else status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except ConnectionFailure as e:
+            logger.error(f"MongoDB connection error: {str(e)}")
+            return _json_response(
+                ERR_DB_CONNECTION,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        except OperationFailure as e:
+            logger.error(f"MongoDB operation error: {str(e)}")
+            return _json_response(
+                ERR_DB_OPERATION,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        except Exception as e:
-            logger.error(f"Unexpected error creating todo: {str(e)}")
-            return Response(
+        except PyMongoError as e:
+            logger.error(f"MongoDB error creating todos: {str(e)}")
+            return _json_response(
                 {
                     'success': False,
-                    'error': 'An unexpected error occurred while creating the todo.'
+                    'error': 'An unexpected error occurred while creating the todos.'
                 },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
 
 class TodoDetailView(APIView):
     """
     API view for handling individual TODO operations.
-    Supports PUT (update todo) and DELETE (delete todo).
+    Supports GET (retrieve todo), PUT (update todo) and DELETE (delete todo).
     """
 
-    def _format_todo(self, todo):
-        """
-        Helper method to format todo document for JSON response.
+    def get(self, request, todo_id):
         """
-        if not todo:
-            return None
+        Retrieve a single TODO item, served from the per-process cache when
+        possible.
         
-        formatted = dict(todo)
-        if '_id' in formatted:
-            formatted['_id'] = str(formatted['_id'])
-        if 'created_at' in formatted and isinstance(formatted['created_at'], datetime):
-            formatted['created_at'] = formatted['created_at'].isoformat()
-        return formatted
+        Returns:
+            HttpResponse: JSON response containing the todo or error message
+        """
+        try:
+            # Validate todo_id
+            if not ObjectId.is_valid(todo_id):
+                return _json_response(
+                    ERR_INVALID_ID,
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            object_id = ObjectId(todo_id)
+            cache_key = str(object_id)
+            
+            formatted_todo, generation = _get_cached_todo(cache_key)
+            
+            if formatted_todo is None:
+                todo = TODOS.find_one({'_id': object_id}, projection=TODO_PROJECTION)
+                if todo is None:
+                    return _json_response(
+                        ERR_NOT_FOUND,
+                        status_code=status.HTTP_404_NOT_FOUND
+                    )
+                formatted_todo = _format_todo(todo)
+                _cache_todo(cache_key, formatted_todo, generation)
+            
+            return _json_response(
+                {
+                    'success': True,
+                    'data': formatted_todo
+                },
+                status_code=status.HTTP_200_OK
+            )
+            
+        except ConnectionFailure as e:
+            logger.error(f"MongoDB connection error: {str(e)}")
+            return _json_response(
+                ERR_DB_CONNECTION,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        except OperationFailure as e:
+            logger.error(f"MongoDB operation error: {str(e)}")
+            return _json_response(
+                ERR_DB_OPERATION,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except PyMongoError as e:
+            logger.error(f"MongoDB error retrieving todo: {str(e)}")
+            return _json_response(
+                {
+                    'success': False,
+                    'error': 'An unexpected error occurred while retrieving the todo.'
+                },
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
     def put(self, request, todo_id):
         """
@@ -226,104 +613,74 @@ class TodoDetailView(APIView):
             }
         
         Returns:
-            Response: JSON response containing updated todo or error message
+            HttpResponse: JSON response containing updated todo or error message
         """
         try:
             # Validate todo_id
-            try:
-                object_id = ObjectId(todo_id)
-            except Exception:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Invalid todo ID format.'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
+            if not ObjectId.is_valid(todo_id):
+                return _json_response(
+                    ERR_INVALID_ID,
+                    status_code=status.HTTP_400_BAD_REQUEST
                 )
+            object_id = ObjectId(todo_id)
             
             # Extract and validate description
-            description = request.data.get('description', '').strip()
+            description, error = _validate_description(request.data)
+            if error is not None:
+                return _json_response(error, status_code=status.HTTP_400_BAD_REQUEST)
             
-            if not description:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Description is required and cannot be empty.'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            MAX_DESCRIPTION_LENGTH = 500
-            if len(description) > MAX_DESCRIPTION_LENGTH:
-                return Response(
-                    {
-                        'success': False,
-                        'error': f'Description cannot exceed {MAX_DESCRIPTION_LENGTH} characters.'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
+            # Update the todo and fetch the updated document in one round-trip
+            try:
+                updated_todo = TODOS.find_one_and_update(
+                    {'_id': object_id},
+                    {'$set': {'description': description}},
+                    projection=TODO_PROJECTION,
+                    return_document=ReturnDocument.AFTER
                 )
-            
-            # Get todos collection
-            todos_collection = db[COLLECTION_NAME]
-            
-            # Check if todo exists
-            existing_todo = todos_collection.find_one({'_id': object_id})
-            if not existing_todo:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Todo not found.'
-                    },
-                    status=status.HTTP_404_NOT_FOUND
+            finally:
+                # A network error can surface after the server applied the
+                # write, so the cached list and todo are stale either way
+                _invalidate_todo_list()
+                _evict_cached_todo(str(object_id))
+            if updated_todo is None:
+                return _json_response(
+                    ERR_NOT_FOUND,
+                    status_code=status.HTTP_404_NOT_FOUND
                 )
             
-            # Update the todo
-            update_result = todos_collection.update_one(
-                {'_id': object_id},
-                {'$set': {'description': description}}
-            )
-            
-            # Retrieve updated todo
-            updated_todo = todos_collection.find_one({'_id': object_id})
-            formatted_todo = self._format_todo(updated_todo)
+            formatted_todo = _format_todo(updated_todo)
             
             logger.info(f"Successfully updated todo with id: {todo_id}")
             
-            return Response(
+            return _json_response(
                 {
                     'success': True,
                     'data': formatted_todo,
                     'message': 'Todo updated successfully'
                 },
-                status=status.HTTP_200_OK
+                status_code=status.HTTP_200_OK
             )
             
         except ConnectionFailure as e:
             logger.error(f"MongoDB connection error: {str(e)}")
-            return Response(
-                {
-                    'success': False,
-                    'error': 'Database connection failed. Please try again later.'
-                },
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            return _json_response(
+                ERR_DB_CONNECTION,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         except OperationFailure as e:
             logger.error(f"MongoDB operation error: {str(e)}")
-            return Response(
-                {
-                    'success': False,
-                    'error': 'Database operation failed. Please try again.'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            return _json_response(
+                ERR_DB_OPERATION,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        except Exception as e:
-            logger.error(f"Unexpected error updating todo: {str(e)}")
-            return Response(
+        except PyMongoError as e:
+            logger.error(f"MongoDB error updating todo: {str(e)}")
+            return _json_response(
                 {
                     'success': False,
                     'error': 'An unexpected error occurred while updating the todo.'
                 },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     def delete(self, request, todo_id):
@@ -331,82 +688,61 @@ class TodoDetailView(APIView):
         Delete a TODO item from MongoDB.
         
         Returns:
-            Response: JSON response confirming deletion or error message
+            HttpResponse: JSON response confirming deletion or error message
         """
         try:
             # Validate todo_id
-            try:
-                object_id = ObjectId(todo_id)
-            except Exception:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Invalid todo ID format.'
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Get todos collection
-            todos_collection = db[COLLECTION_NAME]
-            
-            # Check if todo exists
-            existing_todo = todos_collection.find_one({'_id': object_id})
-            if not existing_todo:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Todo not found.'
-                    },
-                    status=status.HTTP_404_NOT_FOUND
+            if not ObjectId.is_valid(todo_id):
+                return _json_response(
+                    ERR_INVALID_ID,
+                    status_code=status.HTTP_400_BAD_REQUEST
                 )
+            object_id = ObjectId(todo_id)
             
-            # Delete the todo
-            delete_result = todos_collection.delete_one({'_id': object_id})
+            # Delete the todo; a zero deleted_count means it did not exist
+            try:
+                delete_result = TODOS.delete_one({'_id': object_id})
+            finally:
+                # A network error can surface after the server applied the
+                # write, so the cached list and todo are stale either way
+                _invalidate_todo_list()
+                _evict_cached_todo(str(object_id))
             
             if delete_result.deleted_count == 0:
-                return Response(
-                    {
-                        'success': False,
-                        'error': 'Failed to delete todo.'
-                    },
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                return _json_response(
+                    ERR_NOT_FOUND,
+                    status_code=status.HTTP_404_NOT_FOUND
                 )
             
             logger.info(f"Successfully deleted todo with id: {todo_id}")
             
-            return Response(
+            return _json_response(
                 {
                     'success': True,
                     'message': 'Todo deleted successfully'
                 },
-                status=status.HTTP_200_OK
+                status_code=status.HTTP_200_OK
             )
             
         except ConnectionFailure as e:
             logger.error(f"MongoDB connection error: {str(e)}")
-            return Response(
-                {
-                    'success': False,
-                    'error': 'Database connection failed. Please try again later.'
-                },
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            return _json_response(
+                ERR_DB_CONNECTION,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         except OperationFailure as e:
             logger.error(f"MongoDB operation error: {str(e)}")
-            return Response(
-                {
-                    'success': False,
-                    'error': 'Database operation failed. Please try again.'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            return _json_response(
+                ERR_DB_OPERATION,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        except Exception as e:
-            logger.error(f"Unexpected error deleting todo: {str(e)}")
-            return Response(
+        except PyMongoError as e:
+            logger.error(f"MongoDB error deleting todo: {str(e)}")
+            return _json_response(
                 {
                     'success': False,
                     'error': 'An unexpected error occurred while deleting the todo.'
                 },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 